@@ -1157,6 +1157,8 @@ def cmd_snapshot(
                 "compact_refs": True,
                 "read": read,
                 "session": _session,
+                # --force lifts the daemon's byte budget along with the speedbump
+                **({"max_bytes": None} if _force else {}),
             },
         )
     )
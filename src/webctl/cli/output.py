@@ -175,8 +175,25 @@ class OutputFormatter:
         else:
             self._output_auto(data)
 
+    def _output_a11y_truncated(self, data: dict[str, Any]) -> None:
+        """Output the marker sent when a snapshot hits its byte budget."""
+        line = (
+            f"# Output truncated at {data.get('max_bytes')} bytes: "
+            f"{data.get('omitted')} more elements ({data.get('remaining_refs')}). "
+            "Use -F to show all, or --grep/-l to narrow."
+        )
+        self._log(line)
+        if self.color:
+            self._console.print(f"[yellow]{line}[/yellow]")
+        else:
+            print(line)
+
     def _output_a11y_compact(self, data: dict[str, Any]) -> None:
         """Output an a11y item in compact one-line format."""
+        if data.get("_truncated"):
+            self._output_a11y_truncated(data)
+            return
+
         ref = data.get("ref", "")
         node_id = f"@{ref}" if ref else data.get("id", "")
         role = data.get("role", "")
@@ -279,6 +296,10 @@ class OutputFormatter:
 
     def _output_a11y_item(self, data: dict[str, Any]) -> None:
         """Output an a11y tree item."""
+        if data.get("_truncated"):
+            self._output_a11y_truncated(data)
+            return
+
         role = data.get("role", "")
         name = data.get("name", "")
         ref = data.get("ref", "")
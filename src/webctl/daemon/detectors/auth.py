@@ -90,6 +90,23 @@ MFA_CONTENT_PATTERNS = [
 ]
 
 
+def _alternation(patterns: list[str]) -> re.Pattern[str]:
+    """Compile patterns into a single case-insensitive alternation."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.I)
+
+
+def _first_match(
+    any_pattern: re.Pattern[str], patterns: list[re.Pattern[str]], text: str
+) -> str | None:
+    """Source of the first listed pattern found in text, or None."""
+    if not any_pattern.search(text):
+        return None
+    for pattern in patterns:
+        if pattern.search(text):
+            return pattern.pattern
+    return None
+
+
 class AuthDetector:
     """Detect authentication requirements on pages."""
 
@@ -99,6 +116,10 @@ class AuthDetector:
         ]
         self._mfa_patterns = [re.compile(p, re.I) for p in MFA_CONTENT_PATTERNS]
         self._captcha_patterns = [re.compile(p, re.I) for p in CAPTCHA_CONTENT_PATTERNS]
+        # One alternation per list: pages without indicators (the common case) are
+        # rejected in a single scan instead of one scan per pattern
+        self._any_mfa = _alternation(MFA_CONTENT_PATTERNS)
+        self._any_captcha = _alternation(CAPTCHA_CONTENT_PATTERNS)
 
     async def detect(self, page: Page) -> AuthDetectionResult:
         """Detect if page requires authentication or human verification."""
@@ -121,34 +142,30 @@ class AuthDetector:
                     requires_human = True
                 break
 
-        # Check page content for CAPTCHA indicators (higher priority)
         try:
-            content = await page.content()
-            for pattern in self._captcha_patterns:
-                if pattern.search(content):
-                    kind = "captcha"
-                    requires_human = True
-                    confidence = max(confidence, 0.9)
-                    details["captcha_indicator"] = pattern.pattern
-                    break
+            content: str | None = await page.content()
         except Exception:
-            pass
+            content = None
+
+        # Check page content for CAPTCHA indicators (higher priority)
+        if content is not None:
+            captcha_pattern = _first_match(self._any_captcha, self._captcha_patterns, content)
+            if captcha_pattern:
+                kind = "captcha"
+                requires_human = True
+                confidence = max(confidence, 0.9)
+                details["captcha_indicator"] = captcha_pattern
 
         # Check page content for MFA indicators
-        if kind != "captcha":
-            try:
-                content = await page.content()
-                for pattern in self._mfa_patterns:
-                    if pattern.search(content):
-                        if kind == "unknown":
-                            kind = "mfa"
-                        elif kind == "login":
-                            kind = "mfa"  # Upgrade login to MFA if indicators found
-                        confidence = max(confidence, 0.8)
-                        details["mfa_indicator"] = pattern.pattern
-                        break
-            except Exception:
-                pass
+        if kind != "captcha" and content is not None:
+            mfa_pattern = _first_match(self._any_mfa, self._mfa_patterns, content)
+            if mfa_pattern:
+                if kind == "unknown":
+                    kind = "mfa"
+                elif kind == "login":
+                    kind = "mfa"  # Upgrade login to MFA if indicators found
+                confidence = max(confidence, 0.8)
+                details["mfa_indicator"] = mfa_pattern
 
         # Check a11y tree for auth elements
         try:
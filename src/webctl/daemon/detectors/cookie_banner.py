@@ -23,7 +23,7 @@ class CookieBannerResult:
 
 
 # Well-known accept-all selectors for common CMPs
-_ACCEPT_SELECTORS = [
+_ACCEPT_SELECTORS = (
     # OneTrust
     "#onetrust-accept-btn-handler",
     "#accept-recommended-btn-handler",
@@ -73,7 +73,30 @@ _ACCEPT_SELECTORS = [
     "button[aria-label*='Accept all' i]",
     "button[aria-label*='Alle akzeptieren' i]",
     "button[aria-label*='Tout accepter' i]",
-]
+)
+
+# One CSS selector list covering them all, to check for any banner in one probe
+_ACCEPT_SELECTOR_UNION = ", ".join(_ACCEPT_SELECTORS)
+
+# Consent iframes (Sourcepoint, etc.) and accept button labels inside them
+_CONSENT_IFRAME_SELECTORS = (
+    "iframe[id*='sp_message']",  # Sourcepoint
+    "iframe[title*='consent' i]",
+    "iframe[title*='cookie' i]",
+    "iframe[title*='privacy' i]",
+)
+_IFRAME_ACCEPT_TEXTS = (
+    "Einwilligen und weiter",
+    "Einverstanden und weiter",
+    "Alle akzeptieren",
+    "Zustimmen und weiter",
+    "Zustimmen",
+    "Accept all",
+    "Tout accepter",
+    "Akzeptieren",
+    "Accept",
+    "Agree",
+)
 
 
 class CookieBannerDismisser:
@@ -81,8 +104,13 @@ class CookieBannerDismisser:
 
     async def detect_and_dismiss(self, page: Page) -> CookieBannerResult:
         """Try well-known CSS selectors to dismiss cookie banners."""
-        # Try main page selectors first
-        for selector in _ACCEPT_SELECTORS:
+        # Try main page selectors first. Most pages match none of them, so rule that
+        # out with a single count before probing each selector in priority order
+        try:
+            any_match = await page.locator(_ACCEPT_SELECTOR_UNION).count() > 0
+        except Exception:
+            any_match = True
+        for selector in _ACCEPT_SELECTORS if any_match else ():
             try:
                 locator = page.locator(selector)
                 if await locator.count() > 0:
@@ -111,31 +139,17 @@ class CookieBannerDismisser:
 
     async def _try_iframe_consent(self, page: Page) -> CookieBannerResult | None:
         """Try to find and click accept buttons inside consent iframes."""
-        iframe_selectors = [
-            "iframe[id*='sp_message']",  # Sourcepoint
-            "iframe[title*='consent' i]",
-            "iframe[title*='cookie' i]",
-            "iframe[title*='privacy' i]",
-        ]
-        accept_texts = [
-            "Einwilligen und weiter",
-            "Einverstanden und weiter",
-            "Alle akzeptieren",
-            "Zustimmen und weiter",
-            "Zustimmen",
-            "Accept all",
-            "Tout accepter",
-            "Akzeptieren",
-            "Accept",
-            "Agree",
-        ]
-        for iframe_sel in iframe_selectors:
+        # Probe for all consent iframes at once; most pages have none of them
+        counts = await asyncio.gather(
+            *(page.locator(iframe_sel).count() for iframe_sel in _CONSENT_IFRAME_SELECTORS),
+            return_exceptions=True,
+        )
+        for iframe_sel, count in zip(_CONSENT_IFRAME_SELECTORS, counts, strict=True):
+            if not isinstance(count, int) or count == 0:
+                continue
             try:
-                # Check if iframe exists first
-                if await page.locator(iframe_sel).count() == 0:
-                    continue
                 iframe_locator = page.frame_locator(iframe_sel)
-                for text in accept_texts:
+                for text in _IFRAME_ACCEPT_TEXTS:
                     btn = iframe_locator.get_by_role("button", name=text, exact=False)
                     if await btn.count() > 0:
                         await btn.first.click(timeout=3000)
@@ -151,7 +165,10 @@ class CookieBannerDismisser:
         return None
 
 
+# The dismisser holds no state, so one instance serves every call
+_dismisser = CookieBannerDismisser()
+
+
 async def dismiss_cookie_banner(page: Page) -> CookieBannerResult:
     """Attempt to dismiss any cookie consent banner on the page."""
-    dismisser = CookieBannerDismisser()
-    return await dismisser.detect_and_dismiss(page)
+    return await _dismisser.detect_and_dismiss(page)
@@ -3,6 +3,7 @@ Interaction command handlers (click, type, etc.).
 """
 
 import asyncio
+import functools
 import re
 from collections.abc import AsyncIterator, Callable, Coroutine
 from dataclasses import dataclass
@@ -16,13 +17,40 @@ from ...protocol.messages import DoneResponse, ErrorResponse, Request, Response
 from ...query.parser import parse_query
 from ...query.resolver import QueryResolver
 from ...views.filters import INTERACTIVE_ROLES
+from ..detectors.cookie_banner import dismiss_cookie_banner
 from ..session_manager import SessionManager
 from .error_screenshot import capture_error_screenshot
-from .registry import register
+from .registry import HandlerFunc, register
 
 T = TypeVar("T")
 
 
+def _invalidates_snapshot(handler: HandlerFunc) -> HandlerFunc:
+    """
+    Drop the session's cached snapshots when an interaction handler finishes.
+
+    Interactions can change the accessibility tree without mutating the DOM (CSS
+    :hover/:focus-within menus, property-only .checked/.value writes), which the
+    snapshot cache's mutation tracking cannot see. Invalidation happens before the
+    final response is sent, so the client's next snapshot reflects the action.
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(
+        request: Request, session_manager: SessionManager, **kwargs: Any
+    ) -> AsyncIterator[Response]:
+        session_id = request.args.get("session", "default")
+        try:
+            async for response in handler(request, session_manager, **kwargs):
+                if isinstance(response, (DoneResponse, ErrorResponse)):
+                    session_manager.invalidate_snapshots(session_id)
+                yield response
+        finally:
+            session_manager.invalidate_snapshots(session_id)
+
+    return wrapper
+
+
 async def with_retry(
     coro_fn: Callable[[], Coroutine[Any, Any, T]],
     retries: int,
@@ -398,8 +426,6 @@ async def resolve_with_fallbacks(
     max_scrolls: int = 2,
 ) -> ResolveSuccess | ResolveError:
     """Resolve target with automatic fallbacks: overlay dismiss + scroll-to-find."""
-    from ..detectors.cookie_banner import dismiss_cookie_banner
-
     result = await resolve_target(page, session, target, preferred_roles)
     if isinstance(result, ResolveSuccess):
         return result
@@ -449,8 +475,6 @@ async def _click_with_overlay_retry(locator: Any, page: Page) -> None:
     except Exception as e:
         err = str(e).lower()
         if "intercept" in err or "obscur" in err or "overlay" in err:
-            from ..detectors.cookie_banner import dismiss_cookie_banner
-
             await dismiss_cookie_banner(page)
             await asyncio.sleep(0.3)
             await locator.first.click()
@@ -487,6 +511,7 @@ async def _snapshot_after(
 
 
 @register("click")
+@_invalidates_snapshot
 async def handle_click(
     request: Request, session_manager: SessionManager, **kwargs: Any
 ) -> AsyncIterator[Response]:
@@ -571,6 +596,7 @@ async def handle_click(
 
 
 @register("type")
+@_invalidates_snapshot
 async def handle_type(
     request: Request, session_manager: SessionManager, **kwargs: Any
 ) -> AsyncIterator[Response]:
@@ -690,6 +716,7 @@ async def handle_type(
 
 
 @register("set-value")
+@_invalidates_snapshot
 async def handle_set_value(
     request: Request, session_manager: SessionManager, **kwargs: Any
 ) -> AsyncIterator[Response]:
@@ -753,6 +780,7 @@ async def handle_set_value(
 
 
 @register("press")
+@_invalidates_snapshot
 async def handle_press(
     request: Request, session_manager: SessionManager, **kwargs: Any
 ) -> AsyncIterator[Response]:
@@ -791,6 +819,7 @@ async def handle_press(
 
 
 @register("select")
+@_invalidates_snapshot
 async def handle_select(
     request: Request, session_manager: SessionManager, **kwargs: Any
 ) -> AsyncIterator[Response]:
@@ -871,6 +900,7 @@ async def handle_select(
 
 
 @register("check")
+@_invalidates_snapshot
 async def handle_check(
     request: Request, session_manager: SessionManager, **kwargs: Any
 ) -> AsyncIterator[Response]:
@@ -934,6 +964,7 @@ async def handle_check(
 
 
 @register("uncheck")
+@_invalidates_snapshot
 async def handle_uncheck(
     request: Request, session_manager: SessionManager, **kwargs: Any
 ) -> AsyncIterator[Response]:
@@ -997,6 +1028,7 @@ async def handle_uncheck(
 
 
 @register("upload")
+@_invalidates_snapshot
 async def handle_upload(
     request: Request, session_manager: SessionManager, **kwargs: Any
 ) -> AsyncIterator[Response]:
@@ -1074,6 +1106,7 @@ async def handle_upload(
 
 
 @register("fill-form")
+@_invalidates_snapshot
 async def handle_fill_form(
     request: Request, session_manager: SessionManager, **kwargs: Any
 ) -> AsyncIterator[Response]:
@@ -1183,6 +1216,7 @@ async def handle_fill_form(
 
 
 @register("do")
+@_invalidates_snapshot
 async def handle_do(
     request: Request, session_manager: SessionManager, **kwargs: Any
 ) -> AsyncIterator[Response]:
@@ -2,15 +2,23 @@
 Observation command handlers (snapshot, screenshot, etc.).
 """
 
-import base64
+import binascii
+from collections import Counter
 from collections.abc import AsyncIterator
 from difflib import get_close_matches
 from typing import Any
 
+from pydantic_core import to_json
+
 from ...exceptions import ParseError
 from ...protocol.messages import DoneResponse, ErrorResponse, ItemResponse, Request, Response
 from ...query.parser import parse_query
-from ...views.a11y import A11yExtractOptions, extract_a11y_view, parse_aria_snapshot
+from ...views.a11y import (
+    A11Y_MAX_BYTES,
+    A11yExtractOptions,
+    extract_a11y_view,
+    parse_aria_snapshot,
+)
 from ...views.dom_lite import DomLiteOptions, extract_dom_lite_view
 from ...views.markdown import extract_markdown_view
 from ..session_manager import SessionManager
@@ -41,6 +49,7 @@ async def handle_snapshot(
     count_only = request.args.get("count_only", False)
     compact_refs = request.args.get("compact_refs", True)  # Default ON for @refs
     read_mode = request.args.get("read", False)
+    max_bytes = request.args.get("max_bytes", A11Y_MAX_BYTES)  # None disables the cap
 
     # Auto-start session if needed
     try:
@@ -90,19 +99,23 @@ async def handle_snapshot(
                 show_query=show_query,
                 count_only=count_only,
                 compact_refs=compact_refs,
+                max_bytes=max_bytes,
             )
-            # Collect statistics and items during extraction
-            stats: dict[str, Any] = {"total": 0, "by_role": {}}
+            # Reuse the page's cached snapshot if it has not changed since the last call
+            page_info = session_manager.get_active_page_info(session_id)
+            snapshot_cache = page_info.snapshot_cache if page_info else None
+            cached_items = await snapshot_cache.get_items() if snapshot_cache else None
+
+            # extract_a11y_view does all its page work before the first yield, so
+            # collecting the items first costs nothing
+            by_role: Counter[str] = Counter()
             collected_items: list[dict[str, Any]] = []
-            async for item in extract_a11y_view(page, options):
+            async for item in extract_a11y_view(page, options, cached_items):
                 item["req_id"] = request.req_id
-                # Track stats
-                stats["total"] += 1
-                role = item.get("role", "unknown")
-                stats["by_role"][role] = stats["by_role"].get(role, 0) + 1
+                by_role[item.get("role", "unknown")] += 1
                 collected_items.append(item)
 
-            # Store refs if compact_refs mode
+            # Store refs in one step, so concurrent @ref lookups never see a partial set
             if compact_refs:
                 session = session_manager.get_session(session_id)
                 if session:
@@ -113,14 +126,39 @@ async def handle_snapshot(
                         if item_id in id_to_ref:
                             item["ref"] = id_to_ref[item_id]
 
-            # Yield items (unless count_only)
+            # Once the byte budget is spent, the remaining items are replaced by a
+            # single truncation marker (they still have refs)
+            budget = options.max_bytes
+            omitted: list[str] = []
             if not count_only:
                 for item in collected_items:
+                    if budget is not None and not omitted:
+                        budget -= len(to_json(item))
+                    if budget is not None and budget < 0:
+                        omitted.append(item.get("ref") or item.get("id", ""))
+                        continue
                     yield ItemResponse(
                         req_id=request.req_id,
                         view="a11y",
                         data=item,
                     )
+
+            stats: dict[str, Any] = {"total": len(collected_items), "by_role": dict(by_role)}
+            if omitted:
+                stats["truncated"] = len(omitted)
+                yield ItemResponse(
+                    req_id=request.req_id,
+                    view="a11y",
+                    data={
+                        "type": "item",
+                        "view": "a11y",
+                        "_truncated": True,
+                        "max_bytes": options.max_bytes,
+                        "omitted": len(omitted),
+                        "remaining_refs": f"{omitted[0]}-{omitted[-1]}",
+                        "req_id": request.req_id,
+                    },
+                )
             # Include stats in done response
             yield DoneResponse(req_id=request.req_id, ok=True, summary=stats)
 
@@ -187,7 +225,7 @@ async def handle_screenshot(
         else:
             # Return as base64
             screenshot_bytes = await page.screenshot(full_page=full_page)
-            screenshot_b64 = base64.b64encode(screenshot_bytes).decode()
+            screenshot_b64 = binascii.b2a_base64(screenshot_bytes, newline=False).decode("ascii")
             yield ItemResponse(
                 req_id=request.req_id,
                 view="screenshot",
@@ -262,13 +300,18 @@ async def handle_query(
         )
         return
 
-    # Get snapshot
-    try:
-        snapshot_str = await page.locator("body").aria_snapshot()
-    except Exception:
-        snapshot_str = ""
+    # Get snapshot, reusing the page's cached one if nothing changed since
+    page_info = session_manager.get_active_page_info(session_id)
+    if page_info and page_info.snapshot_cache:
+        items = await page_info.snapshot_cache.get_items()
+    else:
+        try:
+            snapshot_str = await page.locator("body").aria_snapshot()
+        except Exception:
+            snapshot_str = ""
+        items = parse_aria_snapshot(snapshot_str) if snapshot_str else []
 
-    if not snapshot_str:
+    if not items:
         yield ErrorResponse(
             req_id=request.req_id,
             error="Could not get page snapshot",
@@ -276,16 +319,15 @@ async def handle_query(
         )
         return
 
-    items = parse_aria_snapshot(snapshot_str)
-
-    # Collect all roles and names for suggestions
+    # Collect all roles and names for suggestions. Names are deduplicated: pages
+    # repeat the same labels many times and each candidate costs a difflib ratio
     all_roles: set[str] = set()
-    all_names: list[str] = []
+    all_names: set[str] = set()
     for item in items:
         if item.get("role"):
             all_roles.add(item["role"])
         if item.get("name"):
-            all_names.append(item["name"])
+            all_names.add(item["name"])
 
     # Simple matching based on query type
     matches = []
@@ -327,7 +369,7 @@ async def handle_query(
     if not matches:
         # Role suggestions
         if query_role and query_role not in all_roles:
-            similar_roles = get_close_matches(query_role, list(all_roles), n=3, cutoff=0.6)
+            similar_roles = get_close_matches(query_role, all_roles, n=3, cutoff=0.6)
             if similar_roles:
                 suggestions.append(
                     f"Role '{query_role}' not found. Did you mean: {', '.join(similar_roles)}?"
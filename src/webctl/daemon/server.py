@@ -6,10 +6,12 @@ The daemon manages browser sessions and handles commands from CLI clients.
 
 import asyncio
 import contextlib
-import json
 import signal
 import sys
 
+from pydantic import ValidationError
+from pydantic_core import to_json
+
 from ..config import DEFAULT_IDLE_TIMEOUT, WebctlConfig
 from ..protocol.messages import ErrorResponse, EventResponse, Request
 from ..protocol.transport import (
@@ -87,7 +89,7 @@ class DaemonServer:
         # Subscribe to events
         async def send_event(event: EventResponse) -> None:
             with contextlib.suppress(Exception):
-                await connection.send_line(event.model_dump_json())
+                await connection.send_line(to_json(event))
 
         self._event_emitter.subscribe(send_event)
 
@@ -99,11 +101,15 @@ class DaemonServer:
 
                 self._last_activity = asyncio.get_running_loop().time()
 
+                # Parse request
                 try:
-                    # Parse request
-                    data = json.loads(line)
-                    request = Request(**data)
+                    request = Request.model_validate_json(line)
+                except ValidationError as e:
+                    error = ErrorResponse(error=f"Invalid request: {e}")
+                    await connection.send_line(to_json(error))
+                    continue
 
+                try:
                     # Get handler
                     handler = get_handler(request.command)
                     if not handler:
@@ -112,7 +118,7 @@ class DaemonServer:
                             error=f"Unknown command: {request.command}",
                             code="unknown_command",
                         )
-                        await connection.send_line(error.model_dump_json())
+                        await connection.send_line(to_json(error))
                         continue
 
                     # Execute handler
@@ -122,14 +128,11 @@ class DaemonServer:
                         event_emitter=self._event_emitter,
                         server=self,
                     ):
-                        await connection.send_line(response.model_dump_json())
+                        await connection.send_line(to_json(response))
 
-                except json.JSONDecodeError as e:
-                    error = ErrorResponse(error=f"Invalid JSON: {e}")
-                    await connection.send_line(error.model_dump_json())
                 except Exception as e:
                     error = ErrorResponse(error=str(e))
-                    await connection.send_line(error.model_dump_json())
+                    await connection.send_line(to_json(error))
 
         finally:
             self._event_emitter.unsubscribe(send_event)
@@ -33,6 +33,15 @@ from .detectors.cookie_banner import CookieBannerDismisser
 from .detectors.network_idle import NetworkIdleDetector
 from .detectors.view_change import ViewChangeDetector, ViewChangeEvent
 from .event_emitter import EventEmitter
+from .snapshot_cache import SnapshotCache
+
+
+async def _write_storage_state(path: Path, state: Any) -> None:
+    """Write browser storage state as JSON, encoding it off the event loop."""
+    # Cookies + localStorage can reach megabytes; json.dumps would stall other clients
+    data = await asyncio.to_thread(json.dumps, state, indent=2)
+    async with aiofiles.open(path, "w") as f:
+        await f.write(data)
 
 
 @dataclass
@@ -45,6 +54,7 @@ class PageInfo:
     kind: Literal["tab", "popup"]
     view_detector: ViewChangeDetector | None = None
     network_idle_detector: NetworkIdleDetector | None = None
+    snapshot_cache: SnapshotCache | None = None
     console_logs: list[dict[str, Any]] = field(default_factory=list)
 
 
@@ -70,33 +80,43 @@ class SessionState:
     # Ref store: maps @e1 -> {role, name, ...} for compact ref-based interactions
     _ref_counter: int = 0
     _refs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Track nth index per (role, name) pair for disambiguation
+    _ref_seen_counts: dict[tuple[str, str], int] = field(default_factory=dict)
 
     def store_refs(self, items: list[dict[str, Any]]) -> dict[str, str]:
         """Store element refs from a snapshot. Returns mapping of item_id -> ref."""
-        self._refs.clear()
-        self._ref_counter = 0
+        self.clear_refs()
         id_to_ref: dict[str, str] = {}
-        # Track nth index per (role, name) pair for disambiguation
-        seen_counts: dict[tuple[str, str], int] = {}
         for item in items:
-            self._ref_counter += 1
-            ref = f"e{self._ref_counter}"
-            role = item.get("role", "")
-            name = item.get("name", "")
-            key = (role, name)
-            nth = seen_counts.get(key, 0)
-            seen_counts[key] = nth + 1
-            self._refs[ref] = {
-                "role": role,
-                "name": name,
-                "id": item.get("id", ""),
-                "nth": nth,
-            }
+            ref = self.add_ref(item)
             item_id = item.get("id", "")
             if item_id:
                 id_to_ref[item_id] = ref
         return id_to_ref
 
+    def clear_refs(self) -> None:
+        """Drop all refs before storing a new snapshot."""
+        self._refs.clear()
+        self._ref_seen_counts.clear()
+        self._ref_counter = 0
+
+    def add_ref(self, item: dict[str, Any]) -> str:
+        """Assign the next ref to a snapshot item."""
+        self._ref_counter += 1
+        ref = f"e{self._ref_counter}"
+        role = item.get("role", "")
+        name = item.get("name", "")
+        key = (role, name)
+        nth = self._ref_seen_counts.get(key, 0)
+        self._ref_seen_counts[key] = nth + 1
+        self._refs[ref] = {
+            "role": role,
+            "name": name,
+            "id": item.get("id", ""),
+            "nth": nth,
+        }
+        return ref
+
     def resolve_ref(self, ref: str) -> dict[str, Any] | None:
         """Resolve a @ref to element data. Accepts 'e1' or '@e1'."""
         key = ref.lstrip("@")
@@ -185,7 +205,7 @@ class SessionManager:
         storage_state = None
         if state_file.exists():
             async with aiofiles.open(state_file) as f:
-                storage_state = json.loads(await f.read())
+                storage_state = await asyncio.to_thread(json.loads, await f.read())
 
         cfg = WebctlConfig.load()
         if mode == "unattended" and cfg.mobile_emulation:
@@ -238,6 +258,7 @@ class SessionManager:
 
         view_detector = ViewChangeDetector(page, page_id, on_view_change)
         network_idle_detector = NetworkIdleDetector(page)
+        snapshot_cache = SnapshotCache(page)
 
         page_info = PageInfo(
             page_id=page_id,
@@ -246,6 +267,7 @@ class SessionManager:
             kind=kind,
             view_detector=view_detector,
             network_idle_detector=network_idle_detector,
+            snapshot_cache=snapshot_cache,
         )
 
         session.pages[page_id] = page_info
@@ -269,8 +291,9 @@ class SessionManager:
             lambda msg: self._on_console_message(page_info, msg),
         )
 
-        # Start view change monitoring
+        # Start view change monitoring and snapshot cache invalidation tracking
         await view_detector.start()
+        await snapshot_cache.start()
 
         # Emit page.opened event
         await self._event_emitter.emit_page_opened(page_id, page.url, kind)
@@ -304,6 +327,8 @@ class SessionManager:
                 await page_info.view_detector.stop()
             if page_info.network_idle_detector:
                 page_info.network_idle_detector.dispose()
+            if page_info.snapshot_cache:
+                page_info.snapshot_cache.dispose()
 
             del session.pages[page_id]
 
@@ -436,6 +461,15 @@ class SessionManager:
             return session.pages.get(session.active_page_id)
         return None
 
+    def invalidate_snapshots(self, session_id: str) -> None:
+        """Drop cached snapshots of all pages in a session, e.g. after an interaction."""
+        session = self.get_session(session_id)
+        if not session:
+            return
+        for page_info in session.pages.values():
+            if page_info.snapshot_cache:
+                page_info.snapshot_cache.invalidate()
+
     def get_active_page_id(self, session_id: str) -> str | None:
         session = self.get_session(session_id)
         return session.active_page_id if session else None
@@ -465,9 +499,7 @@ class SessionManager:
         session = self.get_session(session_id)
         if session and session.context:
             state = await session.context.storage_state()
-            state_file = session.profile_dir / "state.json"
-            async with aiofiles.open(state_file, "w") as f:
-                await f.write(json.dumps(state, indent=2))
+            await _write_storage_state(session.profile_dir / "state.json", state)
 
     async def save_session_as(self, session_id: str, target_name: str) -> None:
         """Save session state under a different profile name."""
@@ -478,9 +510,7 @@ class SessionManager:
             target_dir = get_profile_dir(target_name)
             target_dir.mkdir(parents=True, exist_ok=True)
             state = await session.context.storage_state()
-            state_file = target_dir / "state.json"
-            async with aiofiles.open(state_file, "w") as f:
-                await f.write(json.dumps(state, indent=2))
+            await _write_storage_state(target_dir / "state.json", state)
 
     async def close_session(self, session_id: str) -> None:
         """Close a session and cleanup resources."""
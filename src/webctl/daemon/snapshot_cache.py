@@ -0,0 +1,122 @@
+"""
+Per-page cache for the body aria snapshot.
+
+Read-only commands (snapshot, query) each took a fresh aria_snapshot(), which walks
+the whole accessibility tree even when nothing changed between calls. The cache
+reuses the last snapshot while the page has neither navigated nor mutated.
+
+Mutations are tracked in the page by a MutationObserver that bumps a version
+counter; checking it costs one trivial evaluate instead of a full tree walk.
+"""
+
+import contextlib
+import time
+from typing import Any
+
+from playwright.async_api import Frame, Page
+
+from ..views.a11y import parse_aria_snapshot
+
+# Upper bound on cache age, for changes the observer cannot see (e.g. inside
+# shadow roots or programmatic form state changes)
+SNAPSHOT_CACHE_TTL = 5.0
+
+# Installed in every document of the page; idempotent
+_DOM_VERSION_JS = """
+(() => {
+    if (window.__webctl_dom_version !== undefined) return;
+    window.__webctl_dom_doc = Math.random();
+    window.__webctl_dom_version = 0;
+    const bump = () => { window.__webctl_dom_version++; };
+    new MutationObserver(bump).observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true,
+    });
+    document.addEventListener('input', bump, true);
+    document.addEventListener('change', bump, true);
+})()
+"""
+
+_READ_DOM_VERSION_JS = """
+() => window.__webctl_dom_version === undefined
+    ? null
+    : [window.__webctl_dom_doc, window.__webctl_dom_version]
+"""
+
+
+class SnapshotCache:
+    """Cache the aria snapshot of one page, invalidated on navigation or DOM mutation."""
+
+    def __init__(self, page: Page, ttl: float = SNAPSHOT_CACHE_TTL) -> None:
+        self._page = page
+        self._ttl = ttl
+        self._nav_counter = 0
+        self._key: tuple[Any, ...] | None = None
+        self._stored_at = 0.0
+        self._snapshot = ""
+        self._items: list[dict[str, Any]] | None = None
+        self._disposed = False
+
+        page.on("framenavigated", self._on_frame_navigated)
+
+    async def start(self) -> None:
+        """Install DOM mutation tracking in the current and all future documents."""
+        with contextlib.suppress(Exception):
+            await self._page.add_init_script(_DOM_VERSION_JS)
+        with contextlib.suppress(Exception):
+            await self._page.evaluate(_DOM_VERSION_JS)
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot."""
+        self._nav_counter += 1
+        self._key = None
+        self._items = None
+
+    def _on_frame_navigated(self, frame: Frame) -> None:
+        # Synchronous listener so the cache is dropped before the next command runs
+        if frame == self._page.main_frame:
+            self.invalidate()
+
+    async def _current_key(self) -> tuple[Any, ...] | None:
+        """Navigation + DOM version of the page, or None if it cannot be determined."""
+        try:
+            version = await self._page.evaluate(_READ_DOM_VERSION_JS)
+        except Exception:
+            return None
+        if not version:
+            return None
+        return (self._nav_counter, *version)
+
+    async def get_snapshot(self) -> str:
+        """Body aria snapshot, served from cache while the page is unchanged."""
+        key = await self._current_key()
+        if key is not None and key == self._key and time.monotonic() - self._stored_at < self._ttl:
+            return self._snapshot
+
+        try:
+            snapshot = await self._page.locator("body").aria_snapshot()
+        except Exception:
+            snapshot = ""
+
+        # Key is read before the snapshot, so a concurrent mutation causes a miss later
+        self._key = key
+        self._stored_at = time.monotonic()
+        self._snapshot = snapshot
+        self._items = None
+        return snapshot
+
+    async def get_items(self) -> list[dict[str, Any]]:
+        """Parsed snapshot items. Returns copies, so callers may mutate them."""
+        snapshot = await self.get_snapshot()
+        if self._items is None:
+            self._items = parse_aria_snapshot(snapshot) if snapshot else []
+        return [dict(item) for item in self._items]
+
+    def dispose(self) -> None:
+        """Remove event listeners."""
+        if self._disposed:
+            return
+        self._disposed = True
+        self._page.remove_listener("framenavigated", self._on_frame_navigated)
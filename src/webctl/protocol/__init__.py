@@ -15,6 +15,7 @@ from .messages import (
     Response,
     UserActionRequiredPayload,
     ViewChangedPayload,
+    parse_response,
 )
 from .transport import (
     SOCKET_DIR_ENV,
@@ -35,6 +36,7 @@ __all__ = [
     "EventResponse",
     "ErrorResponse",
     "DoneResponse",
+    "parse_response",
     "EventType",
     "NavigationEventPayload",
     "PageEventPayload",
@@ -2,19 +2,13 @@
 IPC client for CLI-to-daemon communication.
 """
 
-import json
 from collections.abc import AsyncIterator
 from types import TracebackType
 from typing import Any
 
-from .messages import (
-    DoneResponse,
-    ErrorResponse,
-    EventResponse,
-    ItemResponse,
-    Request,
-    Response,
-)
+from pydantic_core import to_json
+
+from .messages import DoneResponse, ErrorResponse, Request, Response, parse_response
 from .transport import get_client_transport
 
 
@@ -34,24 +28,17 @@ class DaemonClient:
     ) -> AsyncIterator[Response]:
         """Send command and stream responses."""
         request = Request(command=command, args=args or {})
-        await self.transport.send_line(request.model_dump_json())
+        await self.transport.send_line(to_json(request))
 
         while True:
             line = await self.transport.recv_line()
             if not line:
                 break
 
-            data = json.loads(line)
+            response = parse_response(line)
+            yield response
 
-            if data["type"] == "done":
-                yield DoneResponse(**data)
-                break
-            elif data["type"] == "item":
-                yield ItemResponse(**data)
-            elif data["type"] == "event":
-                yield EventResponse(**data)
-            elif data["type"] == "error":
-                yield ErrorResponse(**data)
+            if isinstance(response, (DoneResponse, ErrorResponse)):
                 break
 
     async def close(self) -> None:
@@ -11,6 +11,7 @@ from __future__ import annotations
 import socket
 import struct
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -31,24 +32,28 @@ def get_peer_credentials(sock: socket.socket) -> PeerCredentials | None:
 
     Returns None if platform unsupported or credentials unavailable.
     """
-    if sys.platform == "linux":
-        return _get_peer_credentials_linux(sock)
-    elif sys.platform == "darwin":
-        return _get_peer_credentials_macos(sock)
-    elif sys.platform == "win32":
-        return _get_peer_credentials_windows(sock)
-    else:
+    # Only Unix sockets have a peer process; skip the syscall for anything else.
+    # Windows lacks socket.AF_UNIX unless the transport module patched it in (as 1)
+    if sock.family != getattr(socket, "AF_UNIX", 1):
         return None
 
+    return _read_peer_credentials(sock)
+
+
+# struct ucred { pid_t pid; uid_t uid; gid_t gid; }
+_UCRED = struct.Struct("iii")
+# Leading cr_version and cr_uid of struct xucred, and the first cr_groups entry
+_XUCRED_HEAD = struct.Struct("Ii")
+_XUCRED_GID = struct.Struct("i")
+
 
 def _get_peer_credentials_linux(sock: socket.socket) -> PeerCredentials | None:
     """Linux: Use SO_PEERCRED."""
     so_peercred = 17  # SO_PEERCRED from socket.h
 
     try:
-        # struct ucred { pid_t pid; uid_t uid; gid_t gid; }
-        cred = sock.getsockopt(socket.SOL_SOCKET, so_peercred, 12)
-        pid, uid, gid = struct.unpack("iii", cred)
+        cred = sock.getsockopt(socket.SOL_SOCKET, so_peercred, _UCRED.size)
+        pid, uid, gid = _UCRED.unpack(cred)
         return PeerCredentials(uid=uid, gid=gid, pid=pid)
     except OSError:
         return None
@@ -64,8 +69,8 @@ def _get_peer_credentials_macos(sock: socket.socket) -> PeerCredentials | None:
         cred = sock.getsockopt(sol_local, local_peercred, 76)
         if len(cred) < 8:
             return None
-        _version, uid = struct.unpack("Ii", cred[:8])
-        gid = struct.unpack("i", cred[12:16])[0] if len(cred) >= 16 else -1
+        _version, uid = _XUCRED_HEAD.unpack_from(cred)
+        gid = _XUCRED_GID.unpack_from(cred, 12)[0] if len(cred) >= 16 else -1
         return PeerCredentials(uid=uid, gid=gid, pid=None)
     except OSError:
         return None
@@ -140,6 +145,19 @@ def _get_peer_credentials_windows(sock: socket.socket) -> PeerCredentials | None
         kernel32.CloseHandle(proc_handle)
 
 
+def _get_peer_credentials_unsupported(sock: socket.socket) -> PeerCredentials | None:
+    """Platforms without a known peer credential mechanism."""
+    return None
+
+
+# The platform cannot change at runtime, so the lookup is bound once at import
+_read_peer_credentials: Callable[[socket.socket], PeerCredentials | None] = {
+    "linux": _get_peer_credentials_linux,
+    "darwin": _get_peer_credentials_macos,
+    "win32": _get_peer_credentials_windows,
+}.get(sys.platform, _get_peer_credentials_unsupported)
+
+
 def _get_token_user_sid(token_handle: Any) -> Any:
     """Extract user SID from a token handle. Windows only."""
     import ctypes
@@ -6,9 +6,9 @@ RFC-compliant message types for client-daemon communication.
 
 import uuid
 from enum import Enum
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class MessageType(str, Enum):
@@ -71,6 +71,17 @@ class DoneResponse(BaseModel):
 
 Response = ItemResponse | EventResponse | ErrorResponse | DoneResponse
 
+# Decodes and validates a response line in one pass in pydantic-core, picking
+# the model by its "type" tag instead of trying each union member
+_response_adapter: TypeAdapter[Response] = TypeAdapter(
+    Annotated[Response, Field(discriminator="type")]
+)
+
+
+def parse_response(line: str | bytes) -> Response:
+    """Parse a JSON response line into its response model."""
+    return _response_adapter.validate_json(line)
+
 
 # === Event Types (RFC SS11) ===
 
@@ -80,12 +80,22 @@ if sys.platform == "win32":
         return fd
 
 
+def _write_line(writer: asyncio.StreamWriter, data: str | bytes) -> None:
+    """Queue one newline-terminated message on a stream writer."""
+    if isinstance(data, str):
+        data = data.encode()
+    # On Python 3.12+ selector transports, writelines hands both buffers to
+    # sendmsg without concatenating them. Older Pythons and the Windows proactor
+    # transport join them into one copy, which is no worse than data + b"\n"
+    writer.writelines((data, b"\n"))
+
+
 class Transport(ABC):
     @abstractmethod
     async def connect(self) -> None: ...
 
     @abstractmethod
-    async def send_line(self, data: str) -> None: ...
+    async def send_line(self, data: str | bytes) -> None: ...
 
     @abstractmethod
     async def recv_line(self) -> str: ...
@@ -111,8 +121,10 @@ class TransportServer(ABC):
 class ClientConnection(ABC):
     """Represents a single client connection on the server side."""
 
+    __slots__ = ()
+
     @abstractmethod
-    async def send_line(self, data: str) -> None: ...
+    async def send_line(self, data: str | bytes) -> None: ...
 
     @abstractmethod
     async def recv_line(self) -> str | None: ...
@@ -130,6 +142,8 @@ ClientHandler = Callable[["ClientConnection"], Awaitable[None]]
 class StreamClientConnection(ClientConnection):
     """Client connection using asyncio streams."""
 
+    __slots__ = ("_reader", "_writer", "_verified")
+
     def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         self._reader = reader
         self._writer = writer
@@ -151,8 +165,8 @@ class StreamClientConnection(ClientConnection):
         """Whether credentials have been verified."""
         return self._verified
 
-    async def send_line(self, data: str) -> None:
-        self._writer.write((data + "\n").encode())
+    async def send_line(self, data: str | bytes) -> None:
+        _write_line(self._writer, data)
         await self._writer.drain()
 
     async def recv_line(self) -> str | None:
@@ -268,9 +282,9 @@ class UnixSocketClientTransport(Transport):
         except OSError as e:
             raise SocketError(f"Cannot connect to socket: {self.socket_path}\nError: {e}") from e
 
-    async def send_line(self, data: str) -> None:
+    async def send_line(self, data: str | bytes) -> None:
         if self._writer:
-            self._writer.write((data + "\n").encode())
+            _write_line(self._writer, data)
             await self._writer.drain()
 
     async def recv_line(self) -> str:
@@ -406,9 +420,9 @@ if sys.platform == "win32":
                 "  - Antivirus blocking socket file"
             )
 
-        async def send_line(self, data: str) -> None:
+        async def send_line(self, data: str | bytes) -> None:
             if self._writer:
-                self._writer.write((data + "\n").encode())
+                _write_line(self._writer, data)
                 await self._writer.drain()
 
         async def recv_line(self) -> str:
@@ -4,9 +4,93 @@ RFC SS15: Security Considerations
 """
 
 import fnmatch
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Literal
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+
+
+@lru_cache(maxsize=1024)
+def _url_domain(url: str) -> str:
+    """Lowercase host of a URL, without userinfo, port or trailing dot."""
+    # "example.com." is the same host as "example.com"
+    return (urlsplit(url).hostname or "").rstrip(".")
+
+
+class _TrieNode:
+    """Node in a trie of reversed domain labels."""
+
+    __slots__ = ("children", "index")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.index: int | None = None  # Position of the pattern ending here
+
+
+class _PatternMatcher:
+    """
+    Find the first pattern in a list that matches a domain.
+
+    Plain patterns (the domain itself or any subdomain) are stored in a trie keyed
+    by reversed labels, so a lookup walks the domain's labels once instead of
+    testing every pattern. Glob patterns are still checked with fnmatch.
+
+    Plain patterns are canonicalized (lowercase, no trailing dot) and dropped if an
+    earlier one already covers them, e.g. "ads.example.com" after "example.com":
+    it could never be the first match.
+    """
+
+    def __init__(self, patterns: list[str]) -> None:
+        self._patterns = patterns
+        self._root = _TrieNode()
+        self._globs: list[tuple[int, str]] = []
+
+        for index, pattern in enumerate(patterns):
+            pattern = pattern.lower()
+            if "*" in pattern or "?" in pattern:
+                self._globs.append((index, pattern))
+                continue
+            self._insert(pattern.rstrip("."), index)
+
+        # All globs as one regex: most domains match none, and are rejected by a
+        # single scan instead of one fnmatch per glob
+        self._any_glob = (
+            re.compile("|".join(f"(?:{fnmatch.translate(p)})" for _, p in self._globs))
+            if self._globs
+            else None
+        )
+
+    def _insert(self, pattern: str, index: int) -> None:
+        node = self._root
+        for label in reversed(pattern.split(".")):
+            if node.index is not None:
+                return  # Subsumed by an earlier, shorter pattern
+            node = node.children.setdefault(label, _TrieNode())
+        if node.index is None:  # Otherwise a duplicate
+            node.index = index
+
+    def match(self, domain: str) -> str | None:
+        """Return the earliest listed pattern matching the domain, or None."""
+        best: int | None = None
+        node = self._root
+        for label in reversed(domain.split(".")):
+            child = node.children.get(label)
+            if child is None:
+                break
+            node = child
+            if node.index is not None and (best is None or node.index < best):
+                best = node.index
+
+        # Only globs listed before the trie match can take precedence over it
+        if self._any_glob is not None and self._any_glob.match(domain):
+            for index, pattern in self._globs:
+                if best is not None and index > best:
+                    break
+                if fnmatch.fnmatch(domain, pattern):
+                    return self._patterns[index]
+
+        return self._patterns[best] if best is not None else None
 
 
 @dataclass
@@ -32,6 +116,16 @@ class DomainPolicy:
         ]
     )
 
+    # Pattern lists are indexed once at construction
+    _default_deny_matcher: _PatternMatcher = field(init=False, repr=False, compare=False)
+    _allow_matcher: _PatternMatcher = field(init=False, repr=False, compare=False)
+    _deny_matcher: _PatternMatcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._default_deny_matcher = _PatternMatcher(self.default_deny)
+        self._allow_matcher = _PatternMatcher(self.allow_patterns)
+        self._deny_matcher = _PatternMatcher(self.deny_patterns)
+
     def is_allowed(self, url: str) -> tuple[bool, str]:
         """
         Check if URL is allowed by policy.
@@ -40,60 +134,42 @@ class DomainPolicy:
             (allowed: bool, reason: str)
         """
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            # Remove port if present
-            if ":" in domain:
-                domain = domain.split(":")[0]
-
+            domain = _url_domain(url)
         except Exception as e:
             return False, f"Invalid URL: {e}"
 
         # Check default deny list first
-        for pattern in self.default_deny:
-            if self._match_pattern(domain, pattern):
-                return False, f"Domain matches default deny pattern: {pattern}"
+        pattern = self._default_deny_matcher.match(domain)
+        if pattern is not None:
+            return False, f"Domain matches default deny pattern: {pattern}"
 
         if self.mode == "allow":
             # Whitelist mode: must match an allow pattern
-            for pattern in self.allow_patterns:
-                if self._match_pattern(domain, pattern):
-                    return True, f"Domain matches allow pattern: {pattern}"
+            pattern = self._allow_matcher.match(domain)
+            if pattern is not None:
+                return True, f"Domain matches allow pattern: {pattern}"
             return False, "Domain not in allow list"
 
         elif self.mode == "deny":
             # Blacklist mode: must not match a deny pattern
-            for pattern in self.deny_patterns:
-                if self._match_pattern(domain, pattern):
-                    return False, f"Domain matches deny pattern: {pattern}"
+            pattern = self._deny_matcher.match(domain)
+            if pattern is not None:
+                return False, f"Domain matches deny pattern: {pattern}"
             return True, "Domain not in deny list"
 
         else:  # "both"
             # Allow list takes precedence
-            for pattern in self.allow_patterns:
-                if self._match_pattern(domain, pattern):
-                    return True, f"Domain matches allow pattern: {pattern}"
+            pattern = self._allow_matcher.match(domain)
+            if pattern is not None:
+                return True, f"Domain matches allow pattern: {pattern}"
 
             # Then check deny list
-            for pattern in self.deny_patterns:
-                if self._match_pattern(domain, pattern):
-                    return False, f"Domain matches deny pattern: {pattern}"
+            pattern = self._deny_matcher.match(domain)
+            if pattern is not None:
+                return False, f"Domain matches deny pattern: {pattern}"
 
             return True, "Domain not matched by any pattern"
 
-    def _match_pattern(self, domain: str, pattern: str) -> bool:
-        """Match domain against glob pattern."""
-        # Support wildcards: *.example.com, example.*, etc.
-        pattern = pattern.lower()
-
-        # Convert glob to regex
-        if "*" in pattern or "?" in pattern:
-            return fnmatch.fnmatch(domain, pattern)
-
-        # Exact match or subdomain match
-        return domain == pattern or domain.endswith("." + pattern)
-
 
 @dataclass
 class PolicyConfig:
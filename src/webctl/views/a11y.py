@@ -11,6 +11,7 @@ Contains:
 - optional path_hint
 """
 
+import asyncio
 import hashlib
 import re
 from collections.abc import AsyncIterator
@@ -19,9 +20,29 @@ from typing import Any
 
 from playwright.async_api import Page
 
-from .filters import SnapshotFilter, filter_a11y_items, parse_roles_string
+from .filters import LANDMARK_ROLES, SnapshotFilter, filter_a11y_items, parse_roles_string
 from .redaction import redact_if_sensitive
 
+# Leading role word of an aria_snapshot line; compiled once for the per-line loop
+_ROLE_RE = re.compile(r"\w+")
+
+# Max concurrent bbox lookups; each one is a CDP round-trip
+_BBOX_CONCURRENCY = 16
+
+# Default cap on serialized a11y output per snapshot, in bytes
+A11Y_MAX_BYTES = 50_000
+
+# Bounding box of the first matched element, null if none or not rendered
+# (mirrors Playwright's bounding_box(), which returns None for hidden elements)
+_FIRST_BBOX_JS = """
+elements => {
+    const el = elements[0];
+    if (!el || el.getClientRects().length === 0) return null;
+    const r = el.getBoundingClientRect();
+    return {x: r.x, y: r.y, width: r.width, height: r.height};
+}
+"""
+
 
 @dataclass
 class A11yExtractOptions:
@@ -46,6 +67,7 @@ class A11yExtractOptions:
     show_query: bool = False  # Include the query string to target each element
     count_only: bool = False  # Only return stats, no items
     compact_refs: bool = False  # Assign @refs and output compact ref format
+    max_bytes: int | None = A11Y_MAX_BYTES  # Stop streaming items past this size (None = no cap)
 
 
 def parse_aria_snapshot(snapshot: str) -> list[dict[str, Any]]:
@@ -85,10 +107,10 @@ def parse_aria_snapshot(snapshot: str) -> list[dict[str, Any]]:
             "enabled": True,
         }
 
-        match = re.match(r"^(\w+)", line)
+        match = _ROLE_RE.match(line)
         if match:
-            item["role"] = match.group(1)
-            line = line[len(match.group(0)) :].strip()
+            item["role"] = match.group()
+            line = line[match.end() :].strip()
 
         if line.startswith('"'):
             end_quote = line.find('"', 1)
@@ -178,12 +200,9 @@ def _filter_within_scope(items: list[dict[str, Any]], within_query: str) -> list
 
     if container_idx is None:
         # Collect available landmark roles for a helpful error hint
-        _LANDMARK_ROLES = {"main", "navigation", "banner", "contentinfo", "complementary", "region", "search", "form"}
-        available = sorted({
-            item.get("role", "")
-            for item in items
-            if item.get("role", "") in _LANDMARK_ROLES
-        })
+        available = sorted(
+            {item.get("role", "") for item in items if item.get("role", "") in LANDMARK_ROLES}
+        )
         hint = f"No container matching '{within_query}' found."
         if available:
             hint += f" Available landmarks: {', '.join(available)}"
@@ -205,7 +224,9 @@ def _filter_within_scope(items: list[dict[str, Any]], within_query: str) -> list
 
 
 async def extract_a11y_view(
-    page: Page, options: A11yExtractOptions | None = None
+    page: Page,
+    options: A11yExtractOptions | None = None,
+    items: list[dict[str, Any]] | None = None,
 ) -> AsyncIterator[dict[str, Any]]:
     """
     Extract accessibility tree as JSONL items.
@@ -217,18 +238,25 @@ async def extract_a11y_view(
     - enabled, checked, expanded, required: states
     - bbox: {x, y, width, height} (optional)
     - path_hint: semantic path in tree (optional)
+
+    Pass already-parsed snapshot items (e.g. from a cache) to skip fetching the
+    snapshot from the page. They are modified in place.
     """
     options = options or A11yExtractOptions()
 
-    try:
-        snapshot_str = await page.locator("body").aria_snapshot()
-    except Exception:
-        snapshot_str = ""
+    if items is None:
+        try:
+            snapshot_str = await page.locator("body").aria_snapshot()
+        except Exception:
+            snapshot_str = ""
 
-    if not snapshot_str:
-        return
+        if not snapshot_str:
+            return
 
-    items = parse_aria_snapshot(snapshot_str)
+        items = parse_aria_snapshot(snapshot_str)
+
+    if not items:
+        return
 
     if options.within:
         items = _filter_within_scope(items, options.within)
@@ -274,13 +302,18 @@ async def extract_a11y_view(
 
         processed_items.append(item)
 
-    filtered_items = filter_a11y_items(iter(processed_items), filter_config)
+    filtered_items = list(filter_a11y_items(iter(processed_items), filter_config))
 
-    for item in filtered_items:
+    # Fetch bboxes concurrently instead of one round-trip per item in sequence
+    bboxes: list[dict[str, float] | None] = []
+    if options.visible_only or options.include_bbox:
+        bboxes = await _get_element_bboxes(page, filtered_items)
+
+    for index, item in enumerate(filtered_items):
         item.pop("_depth", None)
 
         if options.visible_only:
-            bbox = await _get_element_bbox(page, item)
+            bbox = bboxes[index]
             if bbox:
                 viewport = page.viewport_size
                 if viewport:
@@ -294,7 +327,7 @@ async def extract_a11y_view(
                 if options.include_bbox:
                     item["bbox"] = bbox
         elif options.include_bbox:
-            bbox = await _get_element_bbox(page, item)
+            bbox = bboxes[index]
             if bbox:
                 item["bbox"] = bbox
 
@@ -326,11 +359,25 @@ async def extract_a11y_view(
         yield result
 
 
+async def _get_element_bboxes(
+    page: Page, items: list[dict[str, Any]]
+) -> list[dict[str, float] | None]:
+    """Get bounding boxes for many a11y items with bounded concurrency, preserving order."""
+    semaphore = asyncio.Semaphore(_BBOX_CONCURRENCY)
+
+    async def lookup(item: dict[str, Any]) -> dict[str, float] | None:
+        async with semaphore:
+            return await _get_element_bbox(page, item)
+
+    return list(await asyncio.gather(*(lookup(item) for item in items)))
+
+
 async def _get_element_bbox(page: Page, item: dict[str, Any]) -> dict[str, float] | None:
     """
     Get bounding box for an a11y item.
 
-    Uses role + name to find matching element.
+    Uses role + name to find matching element. The lookup and the geometry read
+    happen in a single evaluate_all round-trip instead of count() + bounding_box().
     """
     role = item.get("role")
     name = item.get("name")
@@ -341,16 +388,14 @@ async def _get_element_bbox(page: Page, item: dict[str, Any]) -> dict[str, float
     try:
         locator = page.get_by_role(role, name=name) if name else page.get_by_role(role)
 
-        count = await locator.count()
-        if count > 0:
-            bbox = await locator.first.bounding_box()
-            if bbox:
-                return {
-                    "x": round(bbox["x"], 1),
-                    "y": round(bbox["y"], 1),
-                    "width": round(bbox["width"], 1),
-                    "height": round(bbox["height"], 1),
-                }
+        bbox = await locator.evaluate_all(_FIRST_BBOX_JS)
+        if bbox:
+            return {
+                "x": round(bbox["x"], 1),
+                "y": round(bbox["y"], 1),
+                "width": round(bbox["width"], 1),
+                "height": round(bbox["height"], 1),
+            }
     except Exception:
         pass
 
@@ -100,17 +100,17 @@ class SnapshotFilter:
             ]
         )
 
-    def should_include_role(self, role: str) -> bool:
-        """Check if a role passes the filter criteria."""
+    def allowed_roles(self) -> frozenset[str] | None:
+        """Set of roles that pass the filter criteria, or None if all roles pass."""
         if self.roles is not None:
-            return role in self.roles
+            return frozenset(self.roles)
 
         if self.interactive_only:
-            if role in INTERACTIVE_ROLES:
-                return True
-            return bool(self.include_landmarks and role in LANDMARK_ROLES)
+            if self.include_landmarks:
+                return INTERACTIVE_ROLES | LANDMARK_ROLES
+            return INTERACTIVE_ROLES
 
-        return True
+        return None
 
 
 def filter_a11y_items(
@@ -133,6 +133,8 @@ def filter_a11y_items(
         yield from items
         return
 
+    # Resolve the role criteria to one set up front: a single lookup per item
+    allowed_roles = filter_config.allowed_roles()
     count = 0
 
     for item in items:
@@ -144,7 +146,7 @@ def filter_a11y_items(
             continue
 
         role = item.get("role", "")
-        if not filter_config.should_include_role(role):
+        if allowed_roles is not None and role not in allowed_roles:
             continue
 
         # Apply grep filter
@@ -127,9 +127,9 @@ class TestConfig:
         assert "Unknown key" in result.stdout or "Unknown key" in result.stderr
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="module")
 def browser_session():
-    """Start a browser session for tests, cleanup after."""
+    """Start one browser session shared by all browser test classes, cleanup after."""
     # Stop any existing daemon first
     run_webctl("stop", check=False)
     time.sleep(0.5)
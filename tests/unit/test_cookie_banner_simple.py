@@ -2,98 +2,135 @@
 Tests for simplified CSS-based cookie banner dismisser.
 """
 
+from unittest.mock import MagicMock
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from playwright.async_api import Page
 
 from webctl.daemon.detectors.cookie_banner import (
+    _ACCEPT_SELECTORS,
+    _CONSENT_IFRAME_SELECTORS,
     CookieBannerDismisser,
     CookieBannerResult,
-    _ACCEPT_SELECTORS,
     dismiss_cookie_banner,
 )
 
 
-def _make_page(matching_selector: str | None = None):
-    """Create a mock page where one selector matches."""
-    page = MagicMock()
+# Plain coroutine functions for stubbed calls that are never asserted on
+async def _click(timeout: float | None = None) -> None:
+    pass
+
+
+async def _failing_click(timeout: float | None = None) -> None:
+    raise Exception("click failed")
+
+
+async def _zero_count() -> int:
+    return 0
+
+
+async def _one_count() -> int:
+    return 1
+
 
-    def make_locator(selector):
-        loc = MagicMock()
-        if matching_selector and selector == matching_selector:
-            loc.count = AsyncMock(return_value=1)
-            loc.first = MagicMock()
-            loc.first.click = AsyncMock()
-        else:
-            loc.count = AsyncMock(return_value=0)
-        return loc
+# Shared by every mock page for selectors that match nothing
+_NO_MATCH = MagicMock()
+_NO_MATCH.count = _zero_count
 
-    page.locator = make_locator
+
+def _button(click=_click):
+    """Locator for one clickable element."""
+    locator = MagicMock()
+    locator.count = _one_count
+    locator.first.click = click
+    return locator
+
+
+def _match_page(buttons):
+    """Create a mock page where each selector in buttons finds its locator."""
+    page = MagicMock(spec=Page)
+
+    def locator(selector):
+        if selector in buttons:
+            return buttons[selector]
+        # The selector union used for the initial probe matches if any part does
+        if any(part in buttons for part in selector.split(", ")):
+            return _button()
+        return _NO_MATCH
+
+    page.locator.side_effect = locator
     return page
 
 
+def _no_match_page():
+    """Create a mock page where no selector matches."""
+    return _match_page({})
+
+
+# The dismisser is stateless, so the class shares one instance
+@pytest.fixture(scope="class")
+def dismisser():
+    return CookieBannerDismisser()
+
+
 class TestCookieBannerDismisser:
     """Test CSS selector cookie banner dismissal."""
 
-    @pytest.mark.asyncio
-    async def test_dismisses_onetrust(self):
-        page = _make_page("#onetrust-accept-btn-handler")
-        dismisser = CookieBannerDismisser()
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_dismisses_onetrust(self, dismisser):
+        page = _match_page({"#onetrust-accept-btn-handler": _button()})
         result = await dismisser.detect_and_dismiss(page)
         assert result.detected
         assert result.dismissed
         assert result.method == "css_selector_click"
         assert result.details["selector"] == "#onetrust-accept-btn-handler"
 
-    @pytest.mark.asyncio
-    async def test_dismisses_amazon(self):
-        page = _make_page("#sp-cc-accept")
-        dismisser = CookieBannerDismisser()
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_dismisses_amazon(self, dismisser):
+        page = _match_page({"#sp-cc-accept": _button()})
         result = await dismisser.detect_and_dismiss(page)
         assert result.detected
         assert result.dismissed
         assert result.details["selector"] == "#sp-cc-accept"
 
-    @pytest.mark.asyncio
-    async def test_no_banner_found(self):
-        page = _make_page(None)
-        dismisser = CookieBannerDismisser()
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_no_banner_found(self, dismisser):
+        page = _no_match_page()
         result = await dismisser.detect_and_dismiss(page)
         assert not result.detected
         assert not result.dismissed
         assert result.method is None
+        # One union probe for the main page, then one per consent iframe selector
+        assert page.locator.call_count == 1 + len(_CONSENT_IFRAME_SELECTORS)
 
-    @pytest.mark.asyncio
-    async def test_click_failure_continues(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_click_failure_continues(self, dismisser):
         """If clicking raises, try next selector."""
-        page = MagicMock()
-        call_count = 0
-
-        def make_locator(selector):
-            nonlocal call_count
-            loc = MagicMock()
-            if selector == "#onetrust-accept-btn-handler":
-                loc.count = AsyncMock(return_value=1)
-                loc.first = MagicMock()
-                loc.first.click = AsyncMock(side_effect=Exception("click failed"))
-                call_count += 1
-            elif selector == "#accept-recommended-btn-handler":
-                loc.count = AsyncMock(return_value=1)
-                loc.first = MagicMock()
-                loc.first.click = AsyncMock()
-                call_count += 1
-            else:
-                loc.count = AsyncMock(return_value=0)
-            return loc
-
-        page.locator = make_locator
-        dismisser = CookieBannerDismisser()
+        page = _match_page(
+            {
+                "#onetrust-accept-btn-handler": _button(_failing_click),
+                "#accept-recommended-btn-handler": _button(),
+            }
+        )
         result = await dismisser.detect_and_dismiss(page)
         assert result.dismissed
-        assert call_count == 2
+        assert result.details["selector"] == "#accept-recommended-btn-handler"
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_dismisses_consent_iframe(self, dismisser):
+        """The first listed iframe present is searched for an accept button."""
+        page = _match_page({"iframe[title*='cookie' i]": _button()})
+        button = page.frame_locator.return_value.get_by_role.return_value
+        button.count = _one_count
+        button.first.click = _click
+        result = await dismisser.detect_and_dismiss(page)
+        assert result.method == "iframe_button_click"
+        assert result.details["iframe"] == "iframe[title*='cookie' i]"
+        page.frame_locator.assert_called_once_with("iframe[title*='cookie' i]")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_convenience_function(self):
-        page = _make_page("#didomi-notice-agree-button")
+        page = _match_page({"#didomi-notice-agree-button": _button()})
         result = await dismiss_cookie_banner(page)
         assert result.dismissed
 
@@ -0,0 +1,117 @@
+"""
+Tests for domain allow/deny policy matching.
+"""
+
+import pytest
+
+from webctl.security.domain_policy import DomainPolicy, PolicyConfig
+
+
+# Policies are built once per class and shared by its parametrized cases
+@pytest.fixture(scope="class")
+def deny_policy():
+    return DomainPolicy(mode="deny", deny_patterns=["blocked.com", "*.ads.*"])
+
+
+@pytest.fixture(scope="class")
+def allow_policy():
+    return DomainPolicy(mode="allow", allow_patterns=["github.com", "*.mycompany.com"])
+
+
+@pytest.fixture(scope="class")
+def both_policy():
+    return DomainPolicy(
+        mode="both", allow_patterns=["docs.example.com"], deny_patterns=["example.com"]
+    )
+
+
+class TestDenyMode:
+    """Blacklist mode with exact, subdomain and glob patterns."""
+
+    @pytest.mark.parametrize(
+        "url,allowed",
+        [
+            ("https://blocked.com/page", False),
+            ("https://www.blocked.com", False),
+            ("https://BLOCKED.com:8443/", False),
+            ("https://blocked.com./", False),
+            ("https://user:pw@blocked.com/", False),
+            ("https://example.com@blocked.com/", False),
+            ("https://notblocked.com", True),
+            ("https://cdn.ads.example.com", False),
+            ("https://example.com", True),
+            ("https://evil.malware.net", False),  # default deny
+        ],
+    )
+    def test_is_allowed(self, deny_policy, url, allowed):
+        assert deny_policy.is_allowed(url)[0] is allowed
+
+    def test_reason_names_pattern(self, deny_policy):
+        assert deny_policy.is_allowed("https://blocked.com") == (
+            False,
+            "Domain matches deny pattern: blocked.com",
+        )
+
+
+class TestAllowMode:
+    """Whitelist mode only admits matching domains."""
+
+    @pytest.mark.parametrize(
+        "url,allowed",
+        [
+            ("https://github.com", True),
+            ("https://api.github.com/repos", True),
+            ("https://intranet.mycompany.com", True),
+            ("https://mycompany.com", False),
+            ("https://gitlab.com", False),
+        ],
+    )
+    def test_is_allowed(self, allow_policy, url, allowed):
+        assert allow_policy.is_allowed(url)[0] is allowed
+
+    def test_reason_for_unlisted_domain(self, allow_policy):
+        assert allow_policy.is_allowed("https://gitlab.com") == (False, "Domain not in allow list")
+
+
+class TestBothMode:
+    """Allow list takes precedence over deny list."""
+
+    @pytest.mark.parametrize(
+        "url,allowed",
+        [
+            ("https://docs.example.com", True),
+            ("https://example.com", False),
+            ("https://shop.example.com", False),
+            ("https://other.org", True),
+        ],
+    )
+    def test_is_allowed(self, both_policy, url, allowed):
+        assert both_policy.is_allowed(url)[0] is allowed
+
+
+def test_policy_config_from_dict():
+    config = PolicyConfig.from_dict(
+        {"enabled": True, "policy": {"mode": "allow", "allow": ["github.com"]}}
+    )
+    assert config.enabled
+    assert config.policy.mode == "allow"
+    assert config.policy.allow_patterns == ["github.com"]
+
+
+def test_reason_reports_first_listed_pattern():
+    """Globs and plain patterns keep list order when both match."""
+    policy = DomainPolicy(mode="deny", deny_patterns=["*.x.com", "a.x.com", "x.com"])
+    assert policy.is_allowed("https://a.x.com")[1] == "Domain matches deny pattern: *.x.com"
+    policy = DomainPolicy(mode="deny", deny_patterns=["x.com", "*.x.com"])
+    assert policy.is_allowed("https://a.x.com")[1] == "Domain matches deny pattern: x.com"
+
+
+def test_subsumed_and_duplicate_patterns_are_pruned():
+    """Patterns covered by an earlier one don't change results."""
+    policy = DomainPolicy(
+        mode="deny", deny_patterns=["Example.com.", "ads.example.com", "example.com"]
+    )
+    assert policy.is_allowed("https://ads.example.com")[1] == (
+        "Domain matches deny pattern: Example.com."
+    )
+    assert policy.is_allowed("https://example.org")[0] is True
@@ -2,15 +2,23 @@
 Tests for markdown view with Readability.js + MarkItDown extraction.
 """
 
+from functools import partial
+from unittest.mock import MagicMock
+
 import pytest
 
 from webctl.views.markdown import (
     MAX_CONTENT_LENGTH,
     _get_readability_js,
     _html_to_markdown,
+    extract_markdown_view,
 )
 
 
+async def _return(value):
+    return value
+
+
 class TestReadabilityJsLoading:
     """Test that vendored Readability.js loads correctly."""
 
@@ -73,11 +81,9 @@ class TestRedaction:
     @pytest.mark.asyncio
     async def test_redaction_applied(self):
         """Secrets in page content should be redacted."""
-        from unittest.mock import AsyncMock, MagicMock
-
         page = MagicMock()
         page.url = "https://example.com"
-        page.title = AsyncMock(return_value="Test")
+        page.title = partial(_return, "Test")
 
         # Mock evaluate to return HTML with a fake AWS key
         async def mock_evaluate(js, *args):
@@ -87,8 +93,6 @@ class TestRedaction:
 
         page.evaluate = mock_evaluate
 
-        from webctl.views.markdown import extract_markdown_view
-
         items = []
         async for item in extract_markdown_view(page):
             items.append(item)
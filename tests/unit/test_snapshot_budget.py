@@ -0,0 +1,116 @@
+"""
+Tests for the a11y snapshot byte budget and its truncation marker.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from webctl.cli.output import OutputFormatter
+from webctl.daemon.handlers import observe
+from webctl.daemon.session_manager import SessionState
+from webctl.protocol.messages import DoneResponse, ItemResponse, Request
+
+
+class _FakeSessionManager:
+    """Session manager with one session and a placeholder page."""
+
+    def __init__(self, profile_dir: Path) -> None:
+        self.session = SessionState(session_id="default", mode="attended", profile_dir=profile_dir)
+        self.page = object()
+
+    async def ensure_session(self, session_id: str) -> None:
+        pass
+
+    def get_active_page(self, session_id: str) -> object:
+        return self.page
+
+    def get_active_page_info(self, session_id: str) -> None:
+        return None
+
+    def get_session(self, session_id: str) -> SessionState:
+        return self.session
+
+
+@pytest.fixture
+def session_manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> _FakeSessionManager:
+    """Session manager whose page yields ten equally sized buttons."""
+
+    async def extract(page, options, cached_items=None):
+        for i in range(10):
+            yield {"id": f"n{i}", "role": "button", "name": "x" * 100}
+
+    monkeypatch.setattr(observe, "extract_a11y_view", extract)
+    return _FakeSessionManager(tmp_path)
+
+
+async def _snapshot(session_manager, **args):
+    request = Request(req_id="r1", command="snapshot", args=args)
+    return [r async for r in observe.handle_snapshot(request, session_manager)]
+
+
+class TestSnapshotByteBudget:
+    """Test snapshot item output: the byte budget and ref storage."""
+
+    @pytest.mark.asyncio
+    async def test_items_stop_at_byte_budget(self, session_manager):
+        responses = await _snapshot(session_manager, max_bytes=500)
+        items = [r for r in responses if isinstance(r, ItemResponse)]
+        *shown, marker = items
+        # Each item serializes to ~150 bytes, so three fit in 500
+        assert [item.data["ref"] for item in shown] == ["e1", "e2", "e3"]
+        assert marker.data["_truncated"] is True
+        assert marker.data["omitted"] == 7
+        assert marker.data["remaining_refs"] == "e4-e10"
+
+        done = responses[-1]
+        assert isinstance(done, DoneResponse)
+        assert done.summary is not None
+        assert done.summary["truncated"] == 7
+        assert done.summary["total"] == 10
+        # Omitted items still get refs
+        assert "e10" in session_manager.session._refs
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_none_disables_budget(self, session_manager):
+        responses = await _snapshot(session_manager, max_bytes=None)
+        items = [r for r in responses if isinstance(r, ItemResponse)]
+        assert len(items) == 10
+        assert not any(item.data.get("_truncated") for item in items)
+        assert "truncated" not in responses[-1].summary
+
+    @pytest.mark.asyncio
+    async def test_refs_replaced_only_after_extraction(self, session_manager, monkeypatch):
+        """Previous refs stay resolvable until the new snapshot is fully extracted."""
+        session = session_manager.session
+        session.store_refs([{"id": "old", "role": "link", "name": "Home"}])
+        seen = []
+
+        async def extract(page, options, cached_items=None):
+            for i in range(3):
+                seen.append(session.resolve_ref("e1"))
+                yield {"id": f"n{i}", "role": "button", "name": "OK"}
+
+        monkeypatch.setattr(observe, "extract_a11y_view", extract)
+        await _snapshot(session_manager)
+        assert all(ref is not None and ref["role"] == "link" for ref in seen)
+        assert session.resolve_ref("e1")["role"] == "button"
+
+
+class TestTruncationNotice:
+    """Test that every output format shows the truncation marker."""
+
+    @pytest.mark.parametrize("fmt", ["auto", "full", "compact"])
+    def test_formatter_shows_truncation_notice(self, fmt, capsys):
+        formatter = OutputFormatter(format=fmt, color=False)
+        marker = {
+            "_truncated": True,
+            "max_bytes": 500,
+            "omitted": 7,
+            "remaining_refs": "e4-e10",
+        }
+        formatter.output({"type": "item", "view": "a11y", "data": marker})
+        formatter.output({"type": "done", "ok": True, "summary": {"total": 10}})
+        out = capsys.readouterr().out
+        assert "Output truncated at 500 bytes: 7 more elements (e4-e10)" in out
+        assert "-F to show all" in out
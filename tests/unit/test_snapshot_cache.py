@@ -0,0 +1,141 @@
+"""
+Tests for the per-page aria snapshot cache and its invalidation.
+"""
+
+import pytest
+
+from webctl.daemon.handlers.interact import _invalidates_snapshot
+from webctl.daemon.snapshot_cache import SnapshotCache
+from webctl.protocol.messages import DoneResponse, Request
+
+
+class _FakeBody:
+    """Body locator that counts aria_snapshot() calls."""
+
+    def __init__(self, snapshot: str) -> None:
+        self.snapshot = snapshot
+        self.calls = 0
+
+    async def aria_snapshot(self) -> str:
+        self.calls += 1
+        return self.snapshot
+
+
+class _FakePage:
+    """Minimal page with a controllable DOM version."""
+
+    def __init__(self, snapshot: str) -> None:
+        self.dom_version: list[float] | None = [0.5, 1]
+        self.body = _FakeBody(snapshot)
+        self.main_frame = object()
+
+    async def evaluate(self, js: str) -> list[float] | None:
+        return self.dom_version
+
+    async def add_init_script(self, script: str) -> None:
+        pass
+
+    def locator(self, selector: str) -> _FakeBody:
+        return self.body
+
+    def on(self, event: str, handler: object) -> None:
+        pass
+
+    def remove_listener(self, event: str, handler: object) -> None:
+        pass
+
+
+def _make_page(snapshot: str = '- button "OK"'):
+    """Create a fake page with a controllable DOM version."""
+    page = _FakePage(snapshot)
+    return page, page.body
+
+
+class TestSnapshotCache:
+    """Test snapshot reuse and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_snapshot_while_unchanged(self):
+        page, body = _make_page()
+        cache = SnapshotCache(page)
+        assert await cache.get_snapshot() == '- button "OK"'
+        assert await cache.get_snapshot() == '- button "OK"'
+        assert body.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_dom_mutation_invalidates(self):
+        page, body = _make_page()
+        cache = SnapshotCache(page)
+        await cache.get_snapshot()
+        page.dom_version = [0.5, 2]
+        await cache.get_snapshot()
+        assert body.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_navigation_invalidates(self):
+        page, body = _make_page()
+        cache = SnapshotCache(page)
+        await cache.get_snapshot()
+        cache._on_frame_navigated(page.main_frame)
+        await cache.get_snapshot()
+        assert body.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_untracked_page_is_not_cached(self):
+        page, body = _make_page()
+        page.dom_version = None
+        cache = SnapshotCache(page)
+        await cache.get_snapshot()
+        await cache.get_snapshot()
+        assert body.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_items_are_copies(self):
+        page, _ = _make_page()
+        cache = SnapshotCache(page)
+        items = await cache.get_items()
+        items[0]["name"] = "changed"
+        again = await cache.get_items()
+        assert again[0]["name"] == "OK"
+        assert again[0]["role"] == "button"
+
+
+class _FakeSessionManager:
+    """Records when snapshots are invalidated."""
+
+    def __init__(self) -> None:
+        self.invalidated = 0
+
+    def invalidate_snapshots(self, session_id: str) -> None:
+        self.invalidated += 1
+
+
+class TestInteractionInvalidation:
+    """Interaction handlers drop cached snapshots before reporting completion."""
+
+    @pytest.mark.asyncio
+    async def test_invalidates_before_done(self):
+        manager = _FakeSessionManager()
+        seen_before_done = []
+
+        @_invalidates_snapshot
+        async def handler(request, session_manager, **kwargs):
+            yield DoneResponse(req_id=request.req_id, ok=True)
+
+        async for _ in handler(Request(command="click"), manager):
+            seen_before_done.append(manager.invalidated)
+        assert seen_before_done == [1]
+
+    @pytest.mark.asyncio
+    async def test_invalidates_when_handler_raises(self):
+        manager = _FakeSessionManager()
+
+        @_invalidates_snapshot
+        async def handler(request, session_manager, **kwargs):
+            raise RuntimeError("click failed")
+            yield
+
+        with pytest.raises(RuntimeError):
+            async for _ in handler(Request(command="click"), manager):
+                pass
+        assert manager.invalidated == 1